@@ -1,106 +1,588 @@
 import asyncio
-import hashlib
+import atexit
+import base64
 import json
 import logging
+import re
+import sqlite3
 import sys
-from datetime import datetime, timedelta
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, BinaryIO, Dict, Iterator, Optional
 
 import requests
 from decouple import config
 from fastmcp import FastMCP
 from lxml import etree
+from requests.adapters import HTTPAdapter
 
-# ロギングの設定
+# ロギングの設定（ログレベルは環境変数または.envの LOG_LEVEL で変更できる）
+LOG_LEVEL = (config("LOG_LEVEL", default="") or "INFO").upper()
+_log_level_known = LOG_LEVEL in logging.getLevelNamesMapping()
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=LOG_LEVEL if _log_level_known else logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
+if not _log_level_known:
+    logger.warning("不明なログレベルのため INFO で出力します: LOG_LEVEL=%s", LOG_LEVEL)
 
 mcp = FastMCP("はてなブログ用MCPサーバー")
 
-HATENA_ID = config("HATENA_ID")
-HATENA_BLOG_ID = config("HATENA_BLOG_ID")
-HATENA_API_KEY = config("HATENA_API_KEY")
+HATENA_ID = config("HATENA_ID", default="")
+HATENA_BLOG_ID = config("HATENA_BLOG_ID", default="")
+HATENA_API_KEY = config("HATENA_API_KEY", default="")
+
+# 認証情報は起動後に変わらないため、起動時に一度だけ確認する
+if not (HATENA_ID and HATENA_BLOG_ID and HATENA_API_KEY):
+    sys.exit("環境変数 HATENA_ID, HATENA_BLOG_ID, HATENA_API_KEY を設定してください")
+
+# APIのURLは起動後に変わらないため、起動時に一度だけ生成する
+COLLECTION_URI = f"https://blog.hatena.ne.jp/{HATENA_ID}/{HATENA_BLOG_ID}/atom/entry"
+ENTRY_URI_BASE = f"{COLLECTION_URI}/"
+
+# HTTP設定
+REQUEST_TIMEOUT = 30  # APIリクエストのタイムアウト（秒）
+API_CONCURRENCY = 8  # APIへ同時に送るリクエストの最大数（レート制限を考慮）
+
+# リクエストは別スレッドで実行するため、スレッド間で同時実行数を制限する
+# （イベントループに依存しないので、複数のツール呼び出しをまたいで効く）
+_api_slots = threading.BoundedSemaphore(API_CONCURRENCY)
+
+# 同一ホストへの接続を使い回すため、セッションを共有する
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+# 終了時にプールしている接続を閉じる
+atexit.register(SESSION.close)
+
+# Basic認証のヘッダー値は固定なので、起動時に一度だけ生成する
+AUTH_HEADER = "Basic " + base64.b64encode(
+    f"{HATENA_ID}:{HATENA_API_KEY}".encode()
+).decode()
+
+
+def set_auth_header(request: requests.PreparedRequest) -> requests.PreparedRequest:
+    """リクエストに認証ヘッダーを設定"""
+    request.headers["Authorization"] = AUTH_HEADER
+    return request
+
+
+SESSION.auth = set_auth_header
+
+# XML名前空間
+NS = {
+    "atom": "http://www.w3.org/2005/Atom",
+    "hatena": "http://www.hatena.ne.jp/info/xmlns#",
+}
+
+# Clark記法のタグ名の接頭辞
+ATOM = f"{{{NS['atom']}}}"
+HATENA = f"{{{NS['hatena']}}}"
+
+# タグ形式のIDから数字のエントリーIDを抽出する
+# 例: "tag:blog.hatena.ne.jp,2013:blog-mtb_beta-10328749687202087533-6802418398316299513" -> "6802418398316299513"
+_ENTRY_ID_RE = re.compile(r"-(\d+)$")
+
+# XMLパーサーのオプション（使わないID表、空白ノード、コメント、実体参照の展開を省く）
+XML_PARSER_OPTIONS: Dict[str, Any] = {
+    "collect_ids": False,
+    "remove_blank_text": True,
+    "remove_comments": True,
+    "resolve_entities": False,
+    "huge_tree": False,
+}
+
+# 記事一覧から取り出せる項目
+LISTING_TEXT_TAGS = {
+    ATOM + "id": "id",
+    ATOM + "title": "title",
+    ATOM + "published": "published",
+    ATOM + "updated": "updated",
+}
+LISTING_FIELD_NAMES = ("id", "title", "link", "published", "updated", "categories")
+LISTING_FIELDS = frozenset(LISTING_FIELD_NAMES)
+
+# 記事一覧のメモリキャッシュ設定
+LISTING_CACHE_TTL_SECONDS = 300  # 記事一覧キャッシュの有効期限（5分）
+LISTING_CACHE_MAX_SIZE = 256  # メモリに保持する記事一覧ページの最大数
 
 # キャッシュ設定
 CACHE_DIR = Path.home() / ".cache" / "hatena-blog-mcp"
 CACHE_EXPIRY_HOURS = 24 * 365  # キャッシュの有効期限（1年）
+CACHE_EXPIRY_SECONDS = CACHE_EXPIRY_HOURS * 3600
+CACHE_DB_PATH = CACHE_DIR / "cache.sqlite"
+CACHE_DB_MMAP_SIZE = 256 * 1024 * 1024  # キャッシュDBをメモリマップする上限（256MB）
+CACHE_DB_BULK_CACHE_KIB = 64 * 1024  # 一括書き込み中のページキャッシュの大きさ（64MB）
+# テーブル構成を変更したら上げる（古い構成のキャッシュは作り直す）
+CACHE_SCHEMA_VERSION = 5
+CACHE_COMPRESSION_LEVEL = 6  # 記事データを保存するときのzlibの圧縮レベル
+ENTRY_CACHE_MAX_SIZE = 2048  # メモリに保持する記事キャッシュの最大数
+
+# json.dumps()は引数を指定すると呼び出しごとにエンコーダーを生成するため、使い回す
+# キャッシュは機械的に読むだけなので、空白を省いたコンパクトな形式で保存する
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+# 検索インデックスのトライグラムで扱える最小の文字数
+SEARCH_INDEX_MIN_KEYWORD = 3
+
+
+async def api_get(
+    url: str, headers: Optional[Dict[str, str]] = None
+) -> requests.Response:
+    """
+    APIにGETリクエストを送信
+
+    requestsは同期APIのため、イベントループをブロックしないよう別スレッドで実行する
+    """
+    logger.debug("API URL: %s", url)
+    response = await asyncio.to_thread(session_get, url, headers)
+    logger.debug("API レスポンス: status_code=%s", response.status_code)
+    return response
+
+
+def session_get(
+    url: str, headers: Optional[Dict[str, str]] = None
+) -> requests.Response:
+    """同時リクエスト数を制限してGETリクエストを送信（ブロッキング）"""
+    with _api_slots:
+        return SESSION.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+
+
+# 記事一覧のメモリキャッシュのキー（URL、最大記事数、取得する項目）
+ListingCacheKey = tuple[str, int, frozenset[str]]
+
+_listing_cache: OrderedDict[
+    ListingCacheKey, tuple[float, Optional[str], Dict[str, Any]]
+] = OrderedDict()
+
+
+def get_cached_listing(
+    key: ListingCacheKey,
+) -> Optional[tuple[float, Optional[str], Dict[str, Any]]]:
+    """
+    メモリキャッシュから記事一覧を取得
+
+    取得時刻、ETag、取得結果を返す。有効期限切れでもETagで再検証できるよう破棄しない
+    """
+    item = _listing_cache.get(key)
+    if item is not None:
+        _listing_cache.move_to_end(key)
+    return item
+
+
+def put_cached_listing(
+    key: ListingCacheKey, result: Dict[str, Any], etag: Optional[str] = None
+):
+    """記事一覧をメモリキャッシュに保存（上限を超えたら古いものから破棄）"""
+    _listing_cache[key] = (time.monotonic(), etag, result)
+    _listing_cache.move_to_end(key)
+    while len(_listing_cache) > LISTING_CACHE_MAX_SIZE:
+        _listing_cache.popitem(last=False)
+
+
+# 読み込んだ記事キャッシュのメモリ上のコピー（キー → (保存時刻, データ)）
+_entry_cache: OrderedDict[str, tuple[float, Dict[str, Any]]] = OrderedDict()
+# 書き込みスレッドからも更新されるため、ロックで保護する
+_entry_cache_lock = threading.Lock()
+# メモリ上の記事キャッシュを破棄するたびに増やす世代番号
+# （読み込み中に破棄された場合に、古い内容をメモリに戻さないようにする）
+_entry_cache_generation = 0
+# メモリ上の記事キャッシュを作った時点のキャッシュDBのdata_version
+_entry_cache_data_version: Optional[int] = None
+
+
+def validate_cached_entries() -> int:
+    """
+    別プロセスがキャッシュDBを更新していたら、メモリ上の記事キャッシュを破棄する
+
+    現在の世代番号を返す
+    """
+    global _entry_cache_generation, _entry_cache_data_version
+    # data_versionは他の接続がコミットしたときだけ変わる
+    (data_version,) = get_cache_db().execute("PRAGMA data_version").fetchone()
+    with _entry_cache_lock:
+        if data_version != _entry_cache_data_version:
+            _entry_cache.clear()
+            _entry_cache_generation += 1
+            _entry_cache_data_version = data_version
+        return _entry_cache_generation
+
+
+def put_cached_entries(
+    entries: Dict[str, tuple[float, Dict[str, Any]]], generation: int
+):
+    """
+    記事キャッシュをメモリに保持（上限を超えたら古いものから破棄）
 
+    読み込み後にメモリ上の記事キャッシュが破棄されていた場合は保持しない
+    """
+    with _entry_cache_lock:
+        if generation != _entry_cache_generation:
+            return
+        for key, item in entries.items():
+            _entry_cache[key] = item
+            _entry_cache.move_to_end(key)
+        while len(_entry_cache) > ENTRY_CACHE_MAX_SIZE:
+            _entry_cache.popitem(last=False)
+
+
+def drop_cached_entries(keys: Optional[list[str]] = None):
+    """メモリ上の記事キャッシュを破棄（キーを省略すると全件）"""
+    global _entry_cache_generation
+    with _entry_cache_lock:
+        _entry_cache_generation += 1
+        if keys is None:
+            _entry_cache.clear()
+            return
+        for key in keys:
+            _entry_cache.pop(key, None)
+
+
+_cache_db: Optional[sqlite3.Connection] = None
+# 書き込みは別スレッドからも行うため、ロックで直列化する
+_cache_db_lock = threading.Lock()
+
+
+def _py_lower(text: Optional[str]) -> Optional[str]:
+    """SQLから呼び出す小文字化関数（全角英字なども小文字にする）"""
+    return text.lower() if text is not None else None
+
+
+def get_cache_db() -> sqlite3.Connection:
+    """キャッシュ用のSQLiteデータベースへの接続を返す（初回呼び出し時に作成）"""
+    global _cache_db
+    if _cache_db is None:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _cache_db = sqlite3.connect(CACHE_DB_PATH, check_same_thread=False)
+        # SQLiteのlower()はASCIIしか小文字にしないため、Pythonの小文字化を使えるようにする
+        _cache_db.create_function("py_lower", 1, _py_lower, deterministic=True)
+        _cache_db.execute("PRAGMA journal_mode=WAL")
+        _cache_db.execute("PRAGMA synchronous=NORMAL")
+        # よく読むページをメモリマップし、読み込み時のコピーとシステムコールを減らす
+        _cache_db.execute(f"PRAGMA mmap_size={CACHE_DB_MMAP_SIZE}")
+        (version,) = _cache_db.execute("PRAGMA user_version").fetchone()
+        if version != CACHE_SCHEMA_VERSION:
+            logger.info("キャッシュの形式が古いため作り直します: version=%s", version)
+            with _cache_db:
+                _cache_db.execute("DROP TABLE IF EXISTS entries")
+                _cache_db.execute("DROP TABLE IF EXISTS search_index")
+                _cache_db.execute("DROP TABLE IF EXISTS entry_categories")
+                _cache_db.execute(f"PRAGMA user_version={CACHE_SCHEMA_VERSION}")
+        _cache_db.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, cached_at REAL NOT NULL, payload BLOB NOT NULL, "
+            "etag TEXT, last_modified TEXT)"
+        )
+        _cache_db.execute(
+            "CREATE INDEX IF NOT EXISTS entries_cached_at ON entries (cached_at)"
+        )
+        # 部分一致検索に対応するため、トライグラムで全文検索インデックスを作る
+        _cache_db.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS search_index "
+            "USING fts5(key UNINDEXED, title, categories, content, tokenize='trigram')"
+        )
+        # カテゴリから記事を引く索引（公開日時の新しい順に取り出せるようにする）
+        _cache_db.execute(
+            "CREATE TABLE IF NOT EXISTS entry_categories ("
+            "key TEXT NOT NULL, category TEXT NOT NULL, published TEXT, "
+            "PRIMARY KEY (key, category)) WITHOUT ROWID"
+        )
+        _cache_db.execute(
+            "CREATE INDEX IF NOT EXISTS entry_categories_published "
+            "ON entry_categories (category, published DESC)"
+        )
+    return _cache_db
+
+
+def _query_search_index(keyword: str, limit: int, heading_only: bool) -> list[str]:
+    """
+    検索インデックスを1回問い合わせてキャッシュキーを取得（内部使用）
 
-def get_auth():
-    """認証情報を返す"""
-    logger.debug(f"認証情報を取得: HATENA_ID={HATENA_ID}")
-    return (HATENA_ID, HATENA_API_KEY)
+    heading_onlyがTrueの場合は、タイトルとカテゴリだけを検索対象にする
+    """
+    db = get_cache_db()
+    if len(keyword) >= SEARCH_INDEX_MIN_KEYWORD:
+        # フレーズ検索にすることで、キーワード全体の部分一致になる
+        query = '"' + keyword.replace('"', '""') + '"'
+        if heading_only:
+            query = "{title categories} : " + query
+        rows = db.execute(
+            "SELECT key FROM search_index WHERE search_index MATCH ? LIMIT ?",
+            (query, limit),
+        )
+    else:
+        # トライグラムに満たない短いキーワードはインデックスを使えないため、
+        # インデックスに保存されている各列と順に照合する
+        columns = ["title", "categories"]
+        if not heading_only:
+            columns.append("content")
+        conditions = " OR ".join(f"instr(py_lower({column}), ?1)" for column in columns)
+        rows = db.execute(
+            f"SELECT key FROM search_index WHERE {conditions} LIMIT ?2",
+            (keyword.lower(), limit),
+        )
+    return [key for (key,) in rows]
+
+
+def search_index(keyword: str, max_results: int) -> list[str]:
+    """
+    検索インデックスからキーワードを含む記事のキャッシュキーを取得
 
+    タイトル、カテゴリ、本文のいずれかに大文字小文字を区別せず部分一致した記事を返す。
+    タイトルかカテゴリで一致した記事を先に返し、件数が足りない場合だけ本文も検索する
+    """
+    keys = _query_search_index(keyword, max_results, heading_only=True)
+    if len(keys) >= max_results:
+        return keys
+
+    # 本文も含めて検索し、タイトルやカテゴリで一致済みの記事を除いて補う
+    found = set(keys)
+    for key in _query_search_index(keyword, max_results + len(keys), heading_only=False):
+        if key not in found:
+            keys.append(key)
+            if len(keys) >= max_results:
+                break
+    return keys
 
-def get_collection_uri():
-    """コレクションURIを生成"""
-    return f"https://blog.hatena.ne.jp/{HATENA_ID}/{HATENA_BLOG_ID}/atom/entry"
+
+def count_categories() -> list[tuple[str, int]]:
+    """カテゴリ索引からカテゴリごとの記事数を取得（記事数の多い順）"""
+    rows = get_cache_db().execute(
+        "SELECT category, COUNT(*) AS count FROM entry_categories "
+        "GROUP BY category ORDER BY count DESC, category"
+    )
+    return rows.fetchall()
 
 
-def get_entry_uri(entry_id: str):
-    """エントリーURIを生成"""
-    return (
-        f"https://blog.hatena.ne.jp/{HATENA_ID}/{HATENA_BLOG_ID}/atom/entry/{entry_id}"
+def category_keys(category: str, max_results: int) -> list[str]:
+    """カテゴリ索引から指定カテゴリの記事のキャッシュキーを取得（公開日時の新しい順）"""
+    rows = get_cache_db().execute(
+        "SELECT key FROM entry_categories WHERE category = ? "
+        "ORDER BY published DESC LIMIT ?",
+        (category, max_results),
     )
+    return [key for (key,) in rows]
 
 
-def get_cache_path(key: str) -> Path:
-    """キャッシュファイルのパスを生成"""
-    # キーをハッシュ化してファイル名にする
-    hashed = hashlib.md5(key.encode()).hexdigest()
-    return CACHE_DIR / f"{hashed}.json"
+def listing_entry_from_cache(key: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """キャッシュした記事から、記事一覧と同じ項目だけを取り出す"""
+    entry = {name: data.get(name) for name in LISTING_FIELD_NAMES}
+    entry["entry_id"] = key.removeprefix("entry_")
+    return entry
+
+
+def has_cache() -> bool:
+    """キャッシュに記事が保存されているかを返す"""
+    if not CACHE_DB_PATH.exists():
+        return False
+    return get_cache_db().execute("SELECT 1 FROM entries LIMIT 1").fetchone() is not None
+
+
+def delete_cache(key: str):
+    """キャッシュから1件削除"""
+    db = get_cache_db()
+    with _cache_db_lock, db:
+        db.execute("DELETE FROM entries WHERE key = ?", (key,))
+        db.execute("DELETE FROM search_index WHERE key = ?", (key,))
+        db.execute("DELETE FROM entry_categories WHERE key = ?", (key,))
+    drop_cached_entries([key])
 
 
 def load_cache(key: str) -> Optional[Dict[str, Any]]:
     """キャッシュを読み込む"""
-    cache_path = get_cache_path(key)
-    logger.debug(f"キャッシュ読み込み: key={key}, path={cache_path}")
-    if not cache_path.exists():
-        logger.debug(f"キャッシュが存在しません: {cache_path}")
-        return None
+    return load_cache_many([key]).get(key)
 
-    try:
-        with open(cache_path, "r", encoding="utf-8") as f:
-            cache_data = json.load(f)
-
-        # キャッシュの有効期限をチェック
-        cached_at = datetime.fromisoformat(cache_data["cached_at"])
-        if datetime.now() - cached_at > timedelta(hours=CACHE_EXPIRY_HOURS):
-            logger.debug(f"キャッシュ期限切れ: {cache_path}")
-            cache_path.unlink()  # 期限切れキャッシュを削除
-            return None
-
-        logger.debug(f"キャッシュヒット: {key}")
-        return cache_data["data"]
-    except (json.JSONDecodeError, KeyError, ValueError) as e:
-        # 不正なキャッシュファイルは削除
-        logger.warning(f"不正なキャッシュファイル: {cache_path}, エラー: {e}")
-        cache_path.unlink()
-        return None
 
+def load_cache_many(keys: list[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    複数のキャッシュを1回のクエリでまとめて読み込む
 
-def save_cache(key: str, data: Dict[str, Any]):
-    """データをキャッシュに保存"""
-    logger.debug(f"キャッシュ保存: key={key}")
-    CACHE_DIR.mkdir(exist_ok=True)
-    cache_path = get_cache_path(key)
+    存在しないキーや期限切れのキーは結果に含まない
+    """
+    if not keys:
+        return {}
+    now = time.time()
+    loaded = {}
+    generation = validate_cached_entries()
+    # メモリに保持している記事はディスクを読まずに返す
+    with _entry_cache_lock:
+        for key in keys:
+            item = _entry_cache.get(key)
+            if item is not None and now - item[0] <= CACHE_EXPIRY_SECONDS:
+                _entry_cache.move_to_end(key)
+                loaded[key] = item[1]
+    missing = [key for key in keys if key not in loaded]
+    if not missing:
+        return loaded
+
+    logger.debug("キャッシュ読み込み: keys=%s", missing)
+    placeholders = ",".join("?" * len(missing))
+    rows = (
+        get_cache_db()
+        .execute(
+            f"SELECT key, cached_at, payload FROM entries WHERE key IN ({placeholders})",
+            missing,
+        )
+        .fetchall()
+    )
 
-    cache_data = {"cached_at": datetime.now().isoformat(), "data": data}
+    read = {}
+    for key, cached_at, payload in rows:
+        # キャッシュの有効期限をチェック（保存時刻はエポック秒）
+        if now - cached_at > CACHE_EXPIRY_SECONDS:
+            logger.debug("キャッシュ期限切れ: %s", key)
+            delete_cache(key)  # 期限切れキャッシュを削除
+            continue
 
-    with open(cache_path, "w", encoding="utf-8") as f:
-        json.dump(cache_data, f, ensure_ascii=False, indent=2)
-    logger.debug(f"キャッシュ保存完了: {cache_path}")
+        try:
+            read[key] = (cached_at, json.loads(zlib.decompress(payload)))
+        except (zlib.error, json.JSONDecodeError) as e:
+            # 不正なキャッシュは削除
+            logger.warning("不正なキャッシュ: %s, エラー: %s", key, e)
+            delete_cache(key)
+    put_cached_entries(read, generation)
+    loaded.update((key, data) for key, (_, data) in read.items())
+    logger.debug("キャッシュヒット: %s件", len(loaded))
+    return loaded
+
+
+def get_cache_validators(key: str) -> Dict[str, str]:
+    """キャッシュに保存したETag/Last-Modifiedから条件付きリクエストのヘッダーを生成"""
+    row = (
+        get_cache_db()
+        .execute("SELECT etag, last_modified FROM entries WHERE key = ?", (key,))
+        .fetchone()
+    )
+    headers = {}
+    if row is not None:
+        etag, last_modified = row
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def touch_cache(keys: list[str]):
+    """更新されていない記事のキャッシュの保存時刻を現在時刻にする"""
+    db = get_cache_db()
+    with _cache_db_lock, db:
+        db.executemany(
+            "UPDATE entries SET cached_at = ? WHERE key = ?",
+            [(time.time(), key) for key in keys],
+        )
+    drop_cached_entries(keys)
+
+
+# キャッシュに保存する記事（キー、データ、ETag、Last-Modified）
+CacheItem = tuple[str, Dict[str, Any], Optional[str], Optional[str]]
+
+
+def save_cache_many(items: list[CacheItem]):
+    """複数のデータを1つのトランザクションでキャッシュに保存"""
+    rows = []
+    index_rows = []
+    category_rows = []
+    for key, data, etag, last_modified in items:
+        logger.debug("キャッシュ保存: key=%s", key)
+        title = data.get("title") or ""
+        categories = "\n".join(data.get("categories", []))
+        content = data.get("content") or ""
+        rows.append(
+            (
+                key,
+                time.time(),
+                # 本文のHTMLはよく縮むため、圧縮して読み書きするデータ量を減らす
+                zlib.compress(
+                    _JSON_ENCODER.encode(data).encode(), CACHE_COMPRESSION_LEVEL
+                ),
+                etag,
+                last_modified,
+            )
+        )
+        index_rows.append((key, title, categories, content))
+        category_rows.extend(
+            (key, category, data.get("published"))
+            for category in set(data.get("categories", []))
+        )
+
+    db = get_cache_db()
+    with _cache_db_lock, db:
+        db.executemany(
+            "INSERT OR REPLACE INTO entries "
+            "(key, cached_at, payload, etag, last_modified) VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        # 記事を検索インデックスに登録
+        db.executemany(
+            "DELETE FROM search_index WHERE key = ?", [(row[0],) for row in rows]
+        )
+        db.executemany(
+            "INSERT INTO search_index (key, title, categories, content) "
+            "VALUES (?, ?, ?, ?)",
+            index_rows,
+        )
+        # 記事をカテゴリ索引に登録
+        db.executemany(
+            "DELETE FROM entry_categories WHERE key = ?", [(row[0],) for row in rows]
+        )
+        db.executemany(
+            "INSERT INTO entry_categories (key, category, published) VALUES (?, ?, ?)",
+            category_rows,
+        )
+    # コミットした後に破棄し、コミット前の内容が読み込まれて残らないようにする
+    drop_cached_entries([row[0] for row in rows])
+    logger.debug("キャッシュ保存完了: %s件", len(rows))
+
+
+@contextmanager
+def bulk_write_mode() -> Iterator[None]:
+    """
+    キャッシュDBを一括書き込み向けの設定にする（終了時に元に戻す）
+
+    キャッシュは再取得できるため、同期中はディスクへの書き出しを待たない
+    """
+    db = get_cache_db()
+    with _cache_db_lock:
+        saved = {
+            name: db.execute(f"PRAGMA {name}").fetchone()[0]
+            for name in ("synchronous", "temp_store", "cache_size")
+        }
+        db.execute("PRAGMA synchronous=OFF")
+        db.execute("PRAGMA temp_store=MEMORY")
+        db.execute(f"PRAGMA cache_size=-{CACHE_DB_BULK_CACHE_KIB}")
+    try:
+        yield
+    finally:
+        with _cache_db_lock:
+            for name, value in saved.items():
+                db.execute(f"PRAGMA {name}={value}")
+
+
+def optimize_search_index():
+    """全文検索インデックスの内部構造を1つにまとめ、検索を速くする"""
+    db = get_cache_db()
+    with _cache_db_lock, db:
+        db.execute("INSERT INTO search_index (search_index) VALUES ('optimize')")
 
 
 def clear_cache():
     """全てのキャッシュをクリア"""
     if CACHE_DIR.exists():
+        # 記事ごとのJSONファイルに保存していた旧形式のキャッシュも削除する
         for cache_file in CACHE_DIR.glob("*.json"):
             cache_file.unlink()
+        if CACHE_DB_PATH.exists():
+            db = get_cache_db()
+            with _cache_db_lock, db:
+                db.execute("DELETE FROM entries")
+                db.execute("DELETE FROM search_index")
+                db.execute("DELETE FROM entry_categories")
+            drop_cached_entries()
         return True
     return False
 
@@ -119,47 +601,8 @@ async def list_entries(
     Returns:
         記事一覧と次ページURL
     """
-    logger.info(f"list_entries 呼び出し: page_url={page_url}, max_results={max_results}")
-    if not all([HATENA_ID, HATENA_BLOG_ID, HATENA_API_KEY]):
-        logger.error("環境変数が設定されていません")
-        return {
-            "error": "環境変数 HATENA_ID, HATENA_BLOG_ID, HATENA_API_KEY を設定してください"
-        }
-
-    url = page_url or get_collection_uri()
-    logger.debug(f"API URL: {url}")
-
-    response = requests.get(url, auth=get_auth())
-    logger.debug(f"API レスポンス: status_code={response.status_code}")
-
-    if response.status_code != 200:
-        logger.error(f"APIエラー: {response.status_code}")
-        return {"error": f"Failed to fetch entries: {response.status_code}"}
-
-    # XMLをパース
-    root = etree.fromstring(response.content)
-    ns = {"atom": "http://www.w3.org/2005/Atom"}
-
-    entries = []
-    for entry in root.xpath("//atom:entry", namespaces=ns)[:max_results]:
-        entry_data = {
-            "id": entry.find("atom:id", ns).text,
-            "title": entry.find("atom:title", ns).text,
-            "link": entry.find("atom:link[@rel='alternate']", ns).get("href"),
-            "published": entry.find("atom:published", ns).text,
-            "updated": entry.find("atom:updated", ns).text,
-            "categories": [
-                cat.get("term") for cat in entry.findall("atom:category", ns)
-            ],
-        }
-        entries.append(entry_data)
-
-    # 次ページのリンクを取得
-    next_link = root.find("atom:link[@rel='next']", ns)
-    next_page_url = next_link.get("href") if next_link is not None else None
-
-    logger.info(f"list_entries 完了: {len(entries)}件の記事を取得")
-    return {"entries": entries, "next_page_url": next_page_url, "count": len(entries)}
+    logger.info("list_entries 呼び出し: page_url=%s, max_results=%s", page_url, max_results)
+    return await fetch_listing(page_url, max_results)
 
 
 @mcp.tool()
@@ -173,16 +616,16 @@ async def get_entry(entry_id: str) -> Dict[str, Any]:
     Returns:
         記事の詳細情報
     """
-    logger.info(f"get_entry 呼び出し: entry_id={entry_id}")
+    logger.info("get_entry 呼び出し: entry_id=%s", entry_id)
     # キャッシュをチェック
     cache_key = f"entry_{entry_id}"
     cached = load_cache(cache_key)
     if cached:
-        logger.info(f"get_entry 完了: キャッシュから取得")
+        logger.info("get_entry 完了: キャッシュから取得")
         return cached
 
     # キャッシュがない場合はエラー
-    logger.warning(f"get_entry: キャッシュに記事が存在しません entry_id={entry_id}")
+    logger.warning("get_entry: キャッシュに記事が存在しません entry_id=%s", entry_id)
     return {"error": "記事が見つかりません。キャッシュを更新してください。"}
 
 
@@ -198,47 +641,19 @@ async def search_entries(keyword: str, max_results: int = 10) -> Dict[str, Any]:
     Returns:
         検索結果の記事一覧
     """
-    logger.info(f"search_entries 呼び出し: keyword={keyword}, max_results={max_results}")
-    if not CACHE_DIR.exists():
-        logger.error("キャッシュディレクトリが存在しません")
+    logger.info("search_entries 呼び出し: keyword=%s, max_results=%s", keyword, max_results)
+    if not has_cache():
+        logger.error("キャッシュが存在しません")
         return {
             "error": "キャッシュが存在しません。サーバー側でキャッシュを更新してください。"
         }
 
-    keyword_lower = keyword.lower()
-    matched_entries = []
-
-    # キャッシュディレクトリ内の全ファイルを検索
-    for cache_file in CACHE_DIR.glob("*.json"):
-        try:
-            cached = load_cache(cache_file.stem)
-            if not cached:
-                continue
-
-            # タイトルで検索
-            if keyword_lower in cached.get("title", "").lower():
-                matched_entries.append(cached)
-                continue
-
-            # カテゴリで検索
-            if any(
-                keyword_lower in cat.lower() for cat in cached.get("categories", [])
-            ):
-                matched_entries.append(cached)
-                continue
-
-            # 本文で検索
-            if keyword_lower in cached.get("content", "").lower():
-                matched_entries.append(cached)
-
-            if len(matched_entries) >= max_results:
-                break
-
-        except Exception as e:
-            logger.warning(f"キャッシュファイル読み込みエラー: {cache_file}, エラー: {e}")
-            continue
+    # インデックスで候補を絞り込み、該当する記事のキャッシュだけをまとめて読み込む
+    keys = search_index(keyword, max_results)
+    cached = load_cache_many(keys)
+    matched_entries = [cached[key] for key in keys if key in cached]
 
-    logger.info(f"search_entries 完了: {len(matched_entries[:max_results])}件の記事がマッチ")
+    logger.info("search_entries 完了: %s件の記事がマッチ", len(matched_entries[:max_results]))
     return {
         "entries": matched_entries[:max_results],
         "count": len(matched_entries[:max_results]),
@@ -254,28 +669,14 @@ async def get_categories() -> Dict[str, Any]:
     Returns:
         カテゴリ一覧と各カテゴリの記事数
     """
-    if not all([HATENA_ID, HATENA_BLOG_ID, HATENA_API_KEY]):
-        return {"error": "環境変数を設定してください"}
-
-    category_count = {}
-    next_url = None
-
-    # 全記事を取得してカテゴリを集計
-    while True:
-        result = await list_entries(page_url=next_url, max_results=50)
-        if "error" in result:
-            return result
-
-        for entry in result["entries"]:
-            for category in entry["categories"]:
-                category_count[category] = category_count.get(category, 0) + 1
-
-        next_url = result.get("next_page_url")
-        if not next_url:
-            break
+    if not has_cache():
+        logger.error("キャッシュが存在しません")
+        return {
+            "error": "キャッシュが存在しません。サーバー側でキャッシュを更新してください。"
+        }
 
-    # カテゴリを記事数でソート
-    sorted_categories = sorted(category_count.items(), key=lambda x: x[1], reverse=True)
+    # キャッシュのカテゴリ索引から集計する（記事数の多い順）
+    sorted_categories = count_categories()
 
     return {
         "categories": [
@@ -299,72 +700,302 @@ async def get_entries_by_category(
     Returns:
         指定カテゴリの記事一覧
     """
-    if not all([HATENA_ID, HATENA_BLOG_ID, HATENA_API_KEY]):
-        return {"error": "環境変数を設定してください"}
+    if not has_cache():
+        logger.error("キャッシュが存在しません")
+        return {
+            "error": "キャッシュが存在しません。サーバー側でキャッシュを更新してください。"
+        }
 
-    category_entries = []
-    next_url = None
+    # カテゴリ索引で該当する記事だけを絞り込み、キャッシュをまとめて読み込む
+    keys = category_keys(category, max_results)
+    cached = load_cache_many(keys)
+    # 本文は返さず、記事一覧と同じ項目にそろえる
+    category_entries = [
+        listing_entry_from_cache(key, cached[key]) for key in keys if key in cached
+    ]
 
-    # ページネーションを使って記事を検索
-    while len(category_entries) < max_results:
-        result = await list_entries(page_url=next_url, max_results=50)
-        if "error" in result:
-            return result
+    return {
+        "entries": category_entries,
+        "count": len(category_entries),
+        "category": category,
+    }
 
-        for entry in result["entries"]:
-            if category in entry["categories"]:
-                category_entries.append(entry)
-                if len(category_entries) >= max_results:
-                    break
 
-        next_url = result.get("next_page_url")
-        if not next_url:
-            break
+class EntryTarget:
+    """
+    記事XMLから必要な項目だけを取り出すパーサーターゲット
 
-    return {
-        "entries": category_entries[:max_results],
-        "count": len(category_entries[:max_results]),
-        "category": category,
+    DOMを構築せず、ルート要素直下の要素だけを1パスで読み取る
+    """
+
+    TEXT_FIELDS = {
+        ATOM + "id": "id",
+        ATOM + "title": "title",
+        ATOM + "content": "content",
+        ATOM + "published": "published",
+        ATOM + "updated": "updated",
+        HATENA + "draft": "draft",
+    }
+
+    def __init__(self):
+        self.fields: Dict[str, Any] = {"categories": []}
+        self._depth = 0
+        self._field: Optional[str] = None
+        self._text: list[str] = []
+
+    def start(self, tag, attrib):
+        self._depth += 1
+        if self._depth != 2:
+            return
+        if tag == ATOM + "category":
+            self.fields["categories"].append(attrib.get("term"))
+        elif tag == ATOM + "link":
+            if attrib.get("rel") == "alternate":
+                self.fields["link"] = attrib.get("href")
+        elif tag in self.TEXT_FIELDS:
+            self._field = self.TEXT_FIELDS[tag]
+            self._text = []
+            if tag == ATOM + "content":
+                self.fields["content_type"] = attrib.get("type", "text")
+
+    def data(self, data):
+        if self._field is not None and self._depth == 2:
+            self._text.append(data)
+
+    def end(self, tag):
+        if self._depth == 2 and self._field is not None:
+            self.fields[self._field] = "".join(self._text)
+            self._field = None
+        self._depth -= 1
+
+    def close(self):
+        return self.fields
+
+
+def parse_listing(
+    source: BinaryIO, max_results: int, fields: frozenset[str] = LISTING_FIELDS
+) -> tuple[list[Dict[str, Any]], Optional[str]]:
+    """
+    記事一覧のXMLをパースし、記事一覧と次ページURLを返す
+
+    fieldsに含まれる項目だけを取り出す（idを含む場合はentry_idも付与する）
+    """
+    text_tags = {
+        tag: name for tag, name in LISTING_TEXT_TAGS.items() if name in fields
     }
+    names = [name for name in LISTING_FIELD_NAMES if name in fields]
+    with_link = "link" in fields
+    with_categories = "categories" in fields
+
+    entries = []
+    next_page_url = None
+    # entry要素を1件ずつ処理し、処理済みの要素は解放してメモリ使用量を抑える
+    for _, elem in etree.iterparse(
+        source, tag=(ATOM + "entry", ATOM + "link"), **XML_PARSER_OPTIONS
+    ):
+        if elem.tag == ATOM + "link":
+            # 次ページのリンクを取得（entry内のlink要素は対象外）
+            if elem.getparent().tag == ATOM + "feed" and elem.get("rel") == "next":
+                next_page_url = elem.get("href")
+            continue
+
+        if len(entries) < max_results:
+            entry_data = dict.fromkeys(names)
+            if with_categories:
+                entry_data["categories"] = []
+            # 子要素を一度だけ走査して、タグごとに値を振り分ける
+            for child in elem:
+                tag = child.tag
+                if tag in text_tags:
+                    entry_data[text_tags[tag]] = child.text
+                elif with_link and tag == ATOM + "link":
+                    if child.get("rel") == "alternate":
+                        entry_data["link"] = child.get("href")
+                elif with_categories and tag == ATOM + "category":
+                    entry_data["categories"].append(child.get("term"))
+            if "id" in entry_data:
+                match = _ENTRY_ID_RE.search(entry_data["id"] or "")
+                entry_data["entry_id"] = match.group(1) if match else None
+            entries.append(entry_data)
+        elem.clear()
+        # 処理済みの兄弟要素もfeedから取り除き、木が大きくならないようにする
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+        # 必要な件数が揃い、次ページのリンクも取得済みなら残りはパースしない
+        if len(entries) >= max_results and next_page_url is not None:
+            break
+
+    return entries, next_page_url
+
+
+def stream_listing(
+    url: str,
+    max_results: int,
+    fields: frozenset[str],
+    headers: Optional[Dict[str, str]] = None,
+) -> tuple[requests.Response, Optional[tuple[list[Dict[str, Any]], Optional[str]]]]:
+    """
+    記事一覧を取得し、レスポンスを受信しながらパースする
+
+    ブロッキング処理のため、別スレッドで実行すること
+    ステータスコードが200以外の場合、パース結果はNoneになる
+    """
+    logger.debug("API URL: %s", url)
+    with _api_slots, SESSION.get(
+        url, headers=headers, timeout=REQUEST_TIMEOUT, stream=True
+    ) as response:
+        logger.debug("API レスポンス: status_code=%s", response.status_code)
+        if response.status_code != 200:
+            return response, None
+        # 圧縮されたレスポンスも展開しながら読み込む
+        response.raw.decode_content = True
+        parsed = parse_listing(response.raw, max_results, fields)
+        # パースを途中で打ち切った場合も接続を再利用できるよう、残りを読み捨てる
+        for _ in response.iter_content(chunk_size=65536):
+            pass
+        return response, parsed
+
+
+async def fetch_listing(
+    page_url: Optional[str] = None,
+    max_results: int = 10,
+    use_cache: bool = True,
+    fields: frozenset[str] = LISTING_FIELDS,
+) -> Dict[str, Any]:
+    """
+    APIから記事一覧を取得（内部使用）
+
+    use_cacheがTrueの場合、同じページの取得結果をメモリ上に一定時間キャッシュする
+    期限切れ後はETagで条件付きリクエストを送り、更新がなければパースせずに再利用する
+    fieldsで必要な項目を指定すると、それ以外の項目は読み取らない
+    """
+    url = page_url or COLLECTION_URI
+    cache_key = (url, max_results, fields)
+    cached = get_cached_listing(cache_key) if use_cache else None
+    headers = None
+    if cached is not None:
+        cached_at, etag, cached_result = cached
+        if time.monotonic() - cached_at <= LISTING_CACHE_TTL_SECONDS:
+            logger.debug("記事一覧のキャッシュヒット: %s", url)
+            return cached_result
+        if etag:
+            headers = {"If-None-Match": etag}
+
+    response, parsed = await asyncio.to_thread(
+        stream_listing, url, max_results, fields, headers
+    )
+
+    if response.status_code == 304 and cached is not None:
+        logger.debug("記事一覧は更新されていません: %s", url)
+        put_cached_listing(cache_key, cached_result, etag)
+        return cached_result
+
+    if parsed is None:
+        logger.error("APIエラー: %s", response.status_code)
+        return {"error": f"Failed to fetch entries: {response.status_code}"}
 
+    entries, next_page_url = parsed
 
-async def fetch_entry_from_api(entry_id: str) -> Dict[str, Any]:
+    logger.info("記事一覧の取得完了: %s件の記事を取得", len(entries))
+    result = {"entries": entries, "next_page_url": next_page_url, "count": len(entries)}
+    if use_cache:
+        put_cached_listing(cache_key, result, response.headers.get("ETag"))
+    return result
+
+
+async def iter_listing_pages(
+    max_results: int = 50,
+    use_cache: bool = True,
+    fields: frozenset[str] = LISTING_FIELDS,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    記事一覧を先頭ページから順に返す（内部使用）
+
+    次ページのURLが分かった時点で次ページの取得を始め、呼び出し側の処理と並行させる
+    取得に失敗した場合はエラーを返して終了する
+    """
+    task: Optional[asyncio.Task] = asyncio.create_task(
+        fetch_listing(None, max_results, use_cache, fields)
+    )
+    try:
+        while task is not None:
+            result = await task
+            task = None
+            next_url = result.get("next_page_url")
+            if next_url:
+                task = asyncio.create_task(
+                    fetch_listing(next_url, max_results, use_cache, fields)
+                )
+            yield result
+    finally:
+        # 途中で打ち切られた場合は、先読み中のページを破棄する
+        if task is not None:
+            task.cancel()
+
+
+async def fetch_entry_from_api(
+    entry_id: str, headers: Optional[Dict[str, str]] = None
+) -> Dict[str, Any]:
     """
     APIから記事を取得（内部使用）
+
+    headersに条件付きリクエストのヘッダーを指定でき、記事が更新されていなければ
+    {"not_modified": True} を返す。取得できた場合は記事とETag/Last-Modifiedを返す
     """
-    logger.debug(f"fetch_entry_from_api: entry_id={entry_id}")
-    if not all([HATENA_ID, HATENA_BLOG_ID, HATENA_API_KEY]):
-        return {"error": "環境変数を設定してください"}
+    logger.debug("fetch_entry_from_api: entry_id=%s", entry_id)
+    response = await api_get(ENTRY_URI_BASE + entry_id, headers)
 
-    url = get_entry_uri(entry_id)
-    logger.debug(f"API URL: {url}")
-    response = requests.get(url, auth=get_auth())
-    logger.debug(f"API レスポンス: status_code={response.status_code}")
+    if response.status_code == 304:
+        return {"not_modified": True}
 
     if response.status_code != 200:
-        logger.error(f"APIエラー: {response.status_code}")
+        logger.error("APIエラー: %s", response.status_code)
         return {"error": f"Failed to fetch entry: {response.status_code}"}
 
-    root = etree.fromstring(response.content)
-    ns = {
-        "atom": "http://www.w3.org/2005/Atom",
-        "hatena": "http://www.hatena.ne.jp/info/xmlns#",
-    }
+    # パーサーターゲットで必要な項目だけを取り出す（close()の戻り値が返る）
+    parser = etree.XMLParser(target=EntryTarget(), **XML_PARSER_OPTIONS)
+    fields = etree.fromstring(response.content, parser)
 
     return {
-        "id": root.find("atom:id", ns).text,
-        "title": root.find("atom:title", ns).text,
-        "content": root.find("atom:content", ns).text,
-        "content_type": root.find("atom:content", ns).get("type", "text"),
-        "published": root.find("atom:published", ns).text,
-        "updated": root.find("atom:updated", ns).text,
-        "categories": [cat.get("term") for cat in root.findall("atom:category", ns)],
-        "draft": root.find("hatena:draft", ns).text == "yes"
-        if root.find("hatena:draft", ns) is not None
-        else False,
+        "entry": {
+            "id": fields.get("id"),
+            "title": fields.get("title"),
+            "link": fields.get("link"),
+            "content": fields.get("content"),
+            "content_type": fields.get("content_type", "text"),
+            "published": fields.get("published"),
+            "updated": fields.get("updated"),
+            "categories": fields["categories"],
+            "draft": fields.get("draft") == "yes",
+        },
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
     }
 
 
+async def _fetch_entry_for_sync(entry_id: str) -> Optional[Dict[str, Any]]:
+    """
+    同期用に記事を1件取得（内部使用）
+
+    キャッシュ済みの記事は条件付きリクエストで取得する。取得に失敗した場合はNoneを返す
+    """
+    try:
+        headers = get_cache_validators(f"entry_{entry_id}")
+        fetched = await fetch_entry_from_api(entry_id, headers)
+    except Exception as e:
+        logger.error("エントリ同期エラー: entry_id=%s, エラー: %s", entry_id, e)
+        return None
+    if "error" in fetched:
+        return None
+    return fetched
+
+
+def _write_synced_page(items: list[CacheItem], unchanged_keys: list[str]):
+    """同期した1ページ分の記事をキャッシュに書き込む（内部使用）"""
+    save_cache_many(items)
+    touch_cache(unchanged_keys)
+
+
 async def sync_all_entries_to_cache() -> Dict[str, Any]:
     """
     全ての記事をキャッシュに同期
@@ -373,42 +1004,70 @@ async def sync_all_entries_to_cache() -> Dict[str, Any]:
         同期結果
     """
     logger.info("キャッシュ同期を開始")
-    if not all([HATENA_ID, HATENA_BLOG_ID, HATENA_API_KEY]):
-        return {"error": "環境変数を設定してください"}
-
     synced_count = 0
+    unchanged_count = 0
     error_count = 0
-    next_url = None
-
-    # 全記事を取得してキャッシュに保存
-    while True:
-        result = await list_entries(page_url=next_url, max_results=50)
-        if "error" in result:
-            return result
-
-        for entry in result["entries"]:
-            # タグ形式のIDから数字のエントリーIDを抽出
-            # 例: "tag:blog.hatena.ne.jp,2013:blog-mtb_beta-10328749687202087533-6802418398316299513" -> "6802418398316299513"
-            entry_id = entry["id"].split("-")[-1]
-            try:
-                # APIから取得してキャッシュに保存
-                entry_detail = await fetch_entry_from_api(entry_id)
-                if "error" not in entry_detail:
-                    save_cache(f"entry_{entry_id}", entry_detail)
-                    synced_count += 1
-                else:
-                    error_count += 1
-            except Exception as e:
-                logger.error(f"エントリ同期エラー: entry_id={entry_id}, エラー: {e}")
-                error_count += 1
-
-        next_url = result.get("next_page_url")
-        if not next_url:
-            break
+    pending_write: Optional[asyncio.Task] = None
 
-    logger.info(f"キャッシュ同期完了: 同期={synced_count}件, エラー={error_count}件")
+    # 全記事を取得してキャッシュに保存（同期時は常に最新の一覧を取得する）
+    pages = iter_listing_pages(use_cache=False, fields=frozenset(["id"]))
+    with bulk_write_mode():
+        try:
+            async for result in pages:
+                if "error" in result:
+                    return result
+
+                entry_ids = [entry["entry_id"] for entry in result["entries"]]
+
+                # ページ内の記事はAPIから並行して取得する（同時実行数はAPI_CONCURRENCYまで）
+                results = await asyncio.gather(
+                    *(_fetch_entry_for_sync(entry_id) for entry_id in entry_ids)
+                )
+                items = []
+                unchanged_keys = []
+                for entry_id, fetched in zip(entry_ids, results):
+                    if fetched is None:
+                        error_count += 1
+                        continue
+                    key = f"entry_{entry_id}"
+                    if fetched.get("not_modified"):
+                        # 更新されていない記事は保存時刻だけを更新する
+                        unchanged_keys.append(key)
+                        continue
+                    items.append(
+                        (
+                            key,
+                            fetched["entry"],
+                            fetched["etag"],
+                            fetched["last_modified"],
+                        )
+                    )
+                synced_count += len(items) + len(unchanged_keys)
+                unchanged_count += len(unchanged_keys)
+
+                # ページ単位でまとめて書き込み、次のページの処理と並行させる
+                if pending_write is not None:
+                    await pending_write
+                pending_write = asyncio.create_task(
+                    asyncio.to_thread(_write_synced_page, items, unchanged_keys)
+                )
+        finally:
+            await pages.aclose()
+            if pending_write is not None:
+                await pending_write
+
+        # 大量に書き込んだ後は、インデックスを最適化しておく
+        await asyncio.to_thread(optimize_search_index)
+
+    logger.info(
+        "キャッシュ同期完了: 同期=%s件（更新なし=%s件）, エラー=%s件",
+        synced_count,
+        unchanged_count,
+        error_count,
+    )
     return {
         "synced": synced_count,
+        "unchanged": unchanged_count,
         "errors": error_count,
         "message": f"{synced_count}件の記事をキャッシュに同期しました",
     }
@@ -422,6 +1081,8 @@ async def update_cache():
         print(f"エラー: {result['error']}")
         return False
     print(f"キャッシュ更新完了: {result['synced']}件の記事を同期しました")
+    if result["unchanged"] > 0:
+        print(f"うち{result['unchanged']}件は更新がありませんでした")
     if result["errors"] > 0:
         print(f"警告: {result['errors']}件のエラーが発生しました")
     return True
@@ -448,7 +1109,7 @@ if __name__ == "__main__":
     else:
         # サーバー起動モード
         # キャッシュが存在しない場合は自動で更新
-        if not CACHE_DIR.exists() or not any(CACHE_DIR.glob("*.json")):
+        if not has_cache():
             logger.info("初回起動のため、キャッシュを更新します")
             print("初回起動のため、キャッシュを更新します...")
             if asyncio.run(update_cache()):